@@ -1,71 +1,119 @@
 import atexit
+import functools
 import logging
+import mmap
 import os
+import re
+import sys
 import time
-import tomllib
 
 from datetime import datetime, timedelta
-from logging.config import dictConfig
-from pathlib import Path
 from typing import Any
 
+# Config files larger than this (in bytes) are read through a memory map instead of buffered reads
+_MMAP_THRESHOLD: int = 65536
+
+# Datetime placeholders supported in the logging filename (e.g., './Log/automatey_<YYYY><MM><DD>.log')
+_PLACEHOLDER_RE: re.Pattern = re.compile(r"<(YYYY|MM|DD|hh|mm|ss|DATE|TIME)>")
+
 
 class Automatey:
     """
     This is the main Automatey module. It contains all the core functionality and classes for the Automatey package.
     """
+    # Fixed instance attribute layout (class-level attributes below are shared and not slots)
+    __slots__ = (
+        '_current_date_time',
+        '_current_year',
+        '_current_month',
+        '_current_day',
+        '_current_date',
+        '_current_hour',
+        '_current_minute',
+        '_current_second',
+        '_current_time',
+        '_config',
+        'config_location',
+        '_get_config_cached',
+    )
+
     # Singleton instance variable
     _instance = None
 
     # Start time of script in seconds (for exit time later)
     _start_time: float = time.time()
 
-    def __new__(cls, *args, **kwargs):
+    # Resolved config file locations keyed by (working directory, config file path)
+    _config_path_cache: dict[tuple[str, str], str] = {}
+
+    # Parsed config files keyed by (config file path, modification time in nanoseconds)
+    _toml_cache: dict[tuple[str, int], dict] = {}
+
+    def __new__(cls, *args, **kwargs) -> "Automatey":
         """
-        Singleton pattern implementation to ensure only one instance of Automatey exists.
+        Keeps 'Automatey(...)' working as an alias of 'Automatey.instance(...)'.
         """
-        if cls._instance is None:
-            cls._instance = super(Automatey, cls).__new__(cls)
-        return cls._instance
+        return cls.instance(*args, **kwargs)
 
-    def __init__(self,
+    @classmethod
+    def instance(cls,
                  config_file_path: str = 'automatey.toml',
                  configure_logging: bool = True,
-                 register_atexit_timer: bool = True) -> None:
+                 register_atexit_timer: bool = True) -> "Automatey":
         """
-        The constructor for the Automatey class.
+        Returns the single Automatey instance, creating it on the first call. Arguments are only used
+        by the first call; later calls return the existing instance as is.
 
+        :param config_file_path: The name or absolute path of the configuration file.
         :param configure_logging: A boolean value indicating whether to configure logging.
         :param register_atexit_timer: A boolean value indicating whether to register the atexit timer.
-        :return: None
+        :return: The Automatey instance.
         """
-        # Prevent re-initialization in singleton pattern
-        if getattr(self, '_initialized', False):
-            return
-        
-        # Mark as initialized (for singleton pattern)
-        self._initialized = True
+        if cls._instance is None:
+            instance = object.__new__(cls)
+            instance._bootstrap(config_file_path, configure_logging, register_atexit_timer)
+            cls._instance = instance
 
+        return cls._instance
+
+    def _bootstrap(self,
+                   config_file_path: str,
+                   configure_logging: bool,
+                   register_atexit_timer: bool) -> None:
+        """
+        Initializes the Automatey instance. Called once by the 'instance' class method.
+
+        :param config_file_path: The name or absolute path of the configuration file.
+        :param configure_logging: A boolean value indicating whether to configure logging.
+        :param register_atexit_timer: A boolean value indicating whether to register the atexit timer.
+        :return: None
+        """
         # Datetime Constant
         self._current_date_time: datetime = datetime.now()
 
+        # Zero-padded 'YYYYMMDDhhmmss' stamp that the date and time constants are sliced from
+        date_time_stamp: str = self._current_date_time.strftime("%Y%m%d%H%M%S")
+
         # Date Constants
-        self._current_year: str = str(self._current_date_time.year)
-        self._current_month: str = str(self._current_date_time.month).rjust(2, '0')
-        self._current_day: str = str(self._current_date_time.day).rjust(2, '0')
-        self._current_date: str = self._current_year + self._current_month + self._current_day
+        self._current_year: str = date_time_stamp[0:4]
+        self._current_month: str = date_time_stamp[4:6]
+        self._current_day: str = date_time_stamp[6:8]
+        self._current_date: str = date_time_stamp[0:8]
 
         # Time Constants (not meant to be accessed outside the class)
-        self._current_hour: str = str(self._current_date_time.hour).rjust(2, '0')
-        self._current_minute: str = str(self._current_date_time.minute).rjust(2, '0')
-        self._current_second: str = str(self._current_date_time.second).rjust(2, '0')
-        self._current_time: str = self._current_hour + self._current_minute + self._current_second
+        self._current_hour: str = date_time_stamp[8:10]
+        self._current_minute: str = date_time_stamp[10:12]
+        self._current_second: str = date_time_stamp[12:14]
+        self._current_time: str = date_time_stamp[8:14]
 
         # Config file location (found by set_config method)
         self.config_location: str = ''
 
+        # Memoized key path lookups (cleared whenever 'config' is replaced)
+        self._get_config_cached = functools.lru_cache(maxsize=256)(self._get_config_uncached)
+
         # Initialize config and core constants
-        self.config: dict = self.set_config(config_file_path)
+        self.config = self.set_config(config_file_path)
 
         if configure_logging:
             self.configure_logging()
@@ -85,50 +133,118 @@ class Automatey:
         # Check if the provided path is absolute first if a configuration file was provided by the user.
         if os.path.isabs(config_file_path):
             try:
-                with open(config_file_path, "rb") as f:
-                    config = tomllib.load(f)
-                    self.config_location = config_file_path
-                    return config
-            except tomllib.TOMLDecodeError as e:
-                raise ValueError(f"Malformed TOML in config file: {config_file_path}") from e
+                config = self._load_config(config_file_path)
+                self.config_location = config_file_path
+                return config
             except FileNotFoundError:
                 raise FileNotFoundError(f"Configuration file '{config_file_path}' not found. Please provide a valid path.")
 
+        # Reuse the location found by a previous walk from the same working directory
+        cache_key: tuple[str, str] = (os.getcwd(), config_file_path)
+        config_path = self._config_path_cache.get(cache_key)
+
         # If not absolute, walk up the directory tree to find the config file by name
-        current_dir = Path(os.getcwd()).resolve()
-        root_dir = current_dir.anchor  # e.g., 'C:\' or '/' depending on OS
-        config_path = None
+        if config_path is None:
+            current_dir: str = os.path.realpath(cache_key[0])
+
+            while True:
+                candidate: str = os.path.join(current_dir, config_file_path)
 
-        while True:
-            candidate = current_dir / config_file_path
+                if os.path.isfile(candidate):
+                    config_path = candidate
+                    self._config_path_cache[cache_key] = config_path
+                    break
 
-            if candidate.exists():
-                config_path = candidate
-                self.config_location = str(config_path)
-                break
-            
-            if str(current_dir) == root_dir:
-                break
+                # The root directory (e.g., 'C:\' or '/' depending on OS) is its own parent
+                parent_dir: str = os.path.dirname(current_dir)
 
-            current_dir = current_dir.parent
+                if parent_dir == current_dir:
+                    break
+
+                current_dir = parent_dir
 
         if config_path is None:
             raise FileNotFoundError(f"Configuration file '{config_file_path}' not found. Please create one in the current directory or any parent directory or provide a valid path.")
 
+        self.config_location = config_path
+
+        return self._load_config(config_path)
+
+    def _load_config(self,
+                     config_path: str) -> dict:
+        """
+        Loads and parses a TOML configuration file. Parsed results are cached by path and modification time,
+        so loading an unchanged file again does not re-parse it.
+
+        :param config_path: The path of the configuration file to load.
+        :return: The loaded configuration as a dictionary.
+        """
+        config_stat: os.stat_result = os.stat(config_path)
+        cache_key: tuple[str, int] = (config_path, config_stat.st_mtime_ns)
+
+        if cache_key in self._toml_cache:
+            return self._toml_cache[cache_key]
+
+        # Imported here so that importing the package (e.g., 'automatey --version') doesn't pay for the parser
+        try:
+            # Optional Rust-backed TOML parser, roughly an order of magnitude faster than tomllib
+            import rtoml as toml_parser
+            toml_decode_error = toml_parser.TomlParsingError
+        except ImportError:
+            import tomllib as toml_parser
+            toml_decode_error = toml_parser.TOMLDecodeError
+
         try:
             with open(config_path, "rb") as f:
-                config = tomllib.load(f)
-                return config
-        except tomllib.TOMLDecodeError as e:
+                # Let the kernel page in large (e.g., generated) config files directly
+                if config_stat.st_size > _MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        data: bytes = mm.read()
+                else:
+                    data = f.read()
+
+            config = toml_parser.loads(data.decode("utf-8"))
+        except (toml_decode_error, UnicodeDecodeError) as e:
             raise ValueError(f"Malformed TOML in config file: {config_path}") from e
 
+        self._toml_cache[cache_key] = config
+        return config
+
+    @property
+    def config(self) -> dict:
+        """
+        Returns the configuration dictionary loaded from the config file.
+        :return: The configuration dictionary.
+        """
+        return self._config
+
+    @config.setter
+    def config(self, config: dict) -> None:
+        """
+        Replaces the configuration dictionary and clears the memoized 'get_config' lookups.
+        :param config: The new configuration dictionary.
+        """
+        self._config = config
+        self._get_config_cached.cache_clear()
+
     def get_config(self, *keys) -> Any:
         """
         Retrieve a nested configuration value from the 'config' dictionary using a sequence of keys.
+        Lookups are memoized per key path until 'config' is replaced. Modifying the dictionary in place
+        isn't detected, so assign a new dictionary to 'config' instead.
 
         :param keys: A sequence of keys to walk down the 'config' dictionary.
         :return: The value at the nested key path, or None if any key is missing.
         """
+        return self._get_config_cached(keys)
+
+    def _get_config_uncached(self, keys: tuple) -> Any:
+        """
+        Walks the 'config' dictionary for the given key path. Use 'get_config' instead, which caches the result.
+
+        :param keys: A tuple of keys to walk down the 'config' dictionary.
+        :return: The value at the nested key path, or None if any key is missing.
+        """
         value: dict = self.config
         
         for key in keys:
@@ -155,11 +271,36 @@ class Automatey:
         
         :return: None
         """
+        # Fetch the logging section once and read individual settings from it
+        logging_settings: dict = self.get_config('automatey', 'logging')
+
+        if not isinstance(logging_settings, dict):
+            logging_settings = {}
+
         # Logging Constants
-        logging_format: str = self.get_config('automatey', 'logging', 'format') or "%(asctime)s: %(levelname)s: %(message)s"
-        logging_datefmt: str = self.get_config('automatey', 'logging', 'datefmt') or "%Y-%m-%d %H:%M:%S"
-        logging_encoding: str = self.get_config('automatey', 'logging', 'encoding') or "utf-8"
-        logging_level: str = self.get_config('automatey', 'logging', 'level') or "INFO"
+        logging_format: str = logging_settings.get('format') or "%(asctime)s: %(levelname)s: %(message)s"
+        logging_datefmt: str = logging_settings.get('datefmt') or "%Y-%m-%d %H:%M:%S"
+        logging_encoding: str = logging_settings.get('encoding') or "utf-8"
+        logging_level: str = logging_settings.get('level') or "INFO"
+
+        # Define file handler defaults
+        enable_file_handler: bool = logging_settings.get('enable_file_handler') or False
+
+        # Console-only logging (the common case) is set up directly, skipping dictConfig's schema processing
+        if enable_file_handler is False:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(logging.Formatter(logging_format, logging_datefmt))
+            console_handler.setLevel(logging_level)
+
+            logger: logging.Logger = self.logger
+
+            for handler in logger.handlers[:]:
+                logger.removeHandler(handler)
+
+            logger.addHandler(console_handler)
+            logger.setLevel(logging_level)
+            logger.propagate = False
+            return
 
         # Define base logging configuration
         logging_config: dict = {
@@ -180,57 +321,51 @@ class Automatey:
                 }
             }
         }
-        
-        # Define file handler defaults
-        enable_file_handler: bool = self.get_config('automatey', 'logging', 'enable_file_handler') or False
-        
-        if enable_file_handler is not False:
-            logging_filename: str = self.get_config('automatey', 'logging', 'filename') or './Log/automatey_<DATE>.log'
-            logging_filemode: str = self.get_config('automatey', 'logging', 'filemode') or "a"
-
-            # Create parent directory path if it doesn't already exist
-            file_directory, file_name = os.path.split(logging_filename)
-            Path(file_directory).mkdir(parents=True, exist_ok=True)
-
-            # Replace datetime format variables in filename
-            logging_filename = logging_filename.replace("<YYYY>", self._current_year)
-            logging_filename = logging_filename.replace("<MM>", self._current_month)
-            logging_filename = logging_filename.replace("<DD>", self._current_day)
-            logging_filename = logging_filename.replace("<hh>", self._current_hour)
-            logging_filename = logging_filename.replace("<mm>", self._current_minute)
-            logging_filename = logging_filename.replace("<ss>", self._current_second)
-            logging_filename = logging_filename.replace("<DATE>", self._current_date)
-            logging_filename = logging_filename.replace("<TIME>", self._current_time)
-
-            # Add file handler to logging configuration
-            logging_config['handlers']['file'] = {
-                "class": "logging.FileHandler",
-                "formatter": "default",
-                "level": logging_level,
-                "filename": logging_filename,
-                "mode": logging_filemode,
-                "encoding": logging_encoding,
-            }
 
-        # Define 'automatey' logger to use both console and file handlers if file handler is enabled
-        if enable_file_handler is not False:
-            logging_config['loggers'] = {
-                'automatey': {
-                    'handlers': ['console', 'file'],
-                    'level': logging_level,
-                    'propagate': False
-                }
-            }
-        else:
-            logging_config['loggers'] = {
-                'automatey': {
-                    'handlers': ['console'],
-                    'level': logging_level,
-                    'propagate': False
-                }
+        # Define file handler settings
+        logging_filename: str = logging_settings.get('filename') or './Log/automatey_<DATE>.log'
+        logging_filemode: str = logging_settings.get('filemode') or "a"
+
+        # Create parent directory path if it doesn't already exist (a single stat when it does)
+        file_directory, file_name = os.path.split(logging_filename)
+
+        if file_directory and not os.path.isdir(file_directory):
+            os.makedirs(file_directory, exist_ok=True)
+
+        # Replace datetime format variables in filename (single pass)
+        placeholders: dict[str, str] = {
+            "YYYY": self._current_year,
+            "MM": self._current_month,
+            "DD": self._current_day,
+            "hh": self._current_hour,
+            "mm": self._current_minute,
+            "ss": self._current_second,
+            "DATE": self._current_date,
+            "TIME": self._current_time,
+        }
+        logging_filename = _PLACEHOLDER_RE.sub(lambda match: placeholders[match.group(1)], logging_filename)
+
+        # Add file handler to logging configuration
+        logging_config['handlers']['file'] = {
+            "class": "logging.FileHandler",
+            "formatter": "default",
+            "level": logging_level,
+            "filename": logging_filename,
+            "mode": logging_filemode,
+            "encoding": logging_encoding,
+        }
+
+        # Define 'automatey' logger to use both console and file handlers
+        logging_config['loggers'] = {
+            'automatey': {
+                'handlers': ['console', 'file'],
+                'level': logging_level,
+                'propagate': False
             }
+        }
 
         # Configure logging
+        from logging.config import dictConfig
         dictConfig(logging_config)
 
     @property
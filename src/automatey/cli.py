@@ -4,7 +4,6 @@ import threading
 import time
 
 from . import __version__
-from .data_tools import combine_csv_files
 
 
 @click.command()
@@ -22,9 +21,9 @@ def automatey_command(version: bool, run: bool, config: str, disable_logging: bo
         # Import and initialize Automatey for running tasks
         from . import Automatey
 
-        _a = Automatey(config_file_path=config,
-                       configure_logging=not disable_logging,
-                       configure_exit_timer=not disable_exit_timer)
+        _a = Automatey.instance(config_file_path=config,
+                                configure_logging=not disable_logging,
+                                register_atexit_timer=not disable_exit_timer)
     
         # Attempt to retrieve the DAG from the configuration
         try:
@@ -38,9 +37,9 @@ def automatey_command(version: bool, run: bool, config: str, disable_logging: bo
             # Retrieve tasks within the DAG (if any)
             tasks: list = dag.get('tasks', [])
             
+            # Each task gets its own (mutable) dependencies list when none is declared
             for task in tasks:
-                if 'dependencies' not in task:
-                    task['dependencies'] = []
+                task.setdefault('dependencies', [])
 
         except KeyError:
             click.echo('No DAG found in the configuration file.')
@@ -51,5 +50,9 @@ def automatey_command(version: bool, run: bool, config: str, disable_logging: bo
 
 @click.command()
 @click.option('--all', is_flag=True, help='Ensures all rows are included when combining CSV files. Duplicates are not removed.')
-def combine_csv_files_command(all: bool = False) -> None:
-    combine_csv_files(all=all)
+@click.option('--verbose', is_flag=True, help='Lists the CSV files being combined and the SQL statement used.')
+def combine_csv_files_command(all: bool = False, verbose: bool = False) -> None:
+    # Import on demand so other commands don't load DuckDB
+    from .duck_tools import combine_csv_files
+
+    combine_csv_files(all=all, verbose=verbose)
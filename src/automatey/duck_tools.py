@@ -1,101 +1,253 @@
 import click
-import duckdb
-import glob
 import os
+import shutil
 
+from typing import Literal
 
-def combine_csv_files(directory_path: str = None, output_file: str = 'combined.csv', all: bool = False) -> None:
+# Rows per Parquet row group / Arrow record batch (DuckDB's default row group size)
+_BATCH_SIZE: int = 122880
+
+# Object store paths and glob patterns are listed by DuckDB (httpfs) rather than walked with os.scandir
+_REMOTE_PREFIXES: tuple = ('s3://', 's3a://', 'gs://', 'gcs://', 'r2://')
+_GLOB_CHARACTERS: str = '*?['
+
+# Scratch table and row number column used by 'split_csv_file' (named so they can't collide with input columns)
+_SPLIT_ROWS_TABLE: str = '__automatey_split_rows'
+_SPLIT_ROW_COLUMN: str = '__automatey_split_row'
+
+# Shared in-memory DuckDB connection, created on first use by '_cursor'
+_connection = None
+
+
+def _cursor() -> 'duckdb.DuckDBPyConnection':
+    """
+    Returns a cursor on the shared in-memory DuckDB connection, creating the connection on first use so
+    repeated calls don't pay for DuckDB's startup. Cursors share the connection's settings and are safe to
+    use from separate threads.
+
+    :return: A new cursor on the shared connection.
+    """
+    global _connection
+
+    if _connection is None:
+        import duckdb
+
+        _connection = duckdb.connect(database=':memory:')
+
+        # Let DuckDB parallelize CSV scans and writes across all cores
+        _connection.execute(f"PRAGMA threads={os.cpu_count() or 1}")
+
+    return _connection.cursor()
+
+
+def _select_list(columns: list[str] = None) -> str:
+    """
+    Builds a SELECT list from the given column names (quoted as identifiers), or '*' when no columns are given.
+
+    :param columns: The names of the columns to select.
+    :return: The SELECT list.
+    """
+    if not columns:
+        return '*'
+
+    return ', '.join('"' + column.replace('"', '""') + '"' for column in columns)
+
+
+def combine_csv_files(directory_path: str = None,
+                      output_file: str = None,
+                      all: bool = False,
+                      output_format: Literal['csv', 'parquet', 'arrow'] = 'csv',
+                      columns: list[str] = None,
+                      verbose: bool = False,
+                      stream: bool = False) -> 'pyarrow.RecordBatchReader | None':
     """
     Combines all CSV files in the specified directory into a single CSV file. If no directory is specified,
     the current working directory is used.
 
-    :param directory_path: The path to the directory containing CSV files.
-    :param output_file: The name of the output combined CSV file.
+    :param directory_path: The path to the directory containing CSV files. Remote directories (e.g. 's3://...')
+                           and glob patterns (e.g. 'data/2024_*.csv') are listed by DuckDB instead.
+    :param output_file: The name of the output combined file ('combined.csv', or 'combined.parquet' for the
+                        'parquet' output format, if not specified), written to the directory. For glob patterns,
+                        it's relative to the current working directory. When it is specified and only one CSV file
+                        is found, that file is copied to it as is.
+    :param all: Keeps duplicate rows when True, otherwise duplicates are removed.
+    :param output_format: 'csv' or 'parquet' (ZSTD compressed) to write 'output_file', or 'arrow' to skip writing
+                          and return a pyarrow RecordBatchReader that streams the combined rows (requires pyarrow).
+    :param columns: The names of the columns to keep (all columns if not specified). Unselected columns are
+                    skipped by DuckDB's CSV reader instead of being parsed.
+    :param verbose: Lists every CSV file found and the SQL statement used when True.
+    :param stream: Writes the 'csv' output from Arrow record batches pulled one at a time, keeping memory bounded
+                   by the batch size regardless of input size (requires pyarrow). Arrow's CSV writer quotes all
+                   string values. Raises a ValueError for other output formats.
+    :return: The RecordBatchReader for the 'arrow' output format (when at least one CSV file is found),
+             otherwise None.
     """
+    if output_format not in ('csv', 'parquet', 'arrow'):
+        raise ValueError(f"Unsupported output format: '{output_format}'. Expected 'csv', 'parquet' or 'arrow'.")
+
+    if stream and output_format != 'csv':
+        raise ValueError(f"Streaming is only supported for the 'csv' output format, not '{output_format}'.")
+
     if directory_path is None:
         directory_path = '.'
 
-    # Find all CSV files in the specified directory
-    csv_files: list = glob.glob(os.path.join(directory_path, '*.csv'))
+    is_remote: bool = directory_path.startswith(_REMOTE_PREFIXES)
+
+    # Existing local directories are never patterns, even if their names contain '[', '?' or '*'
+    is_pattern: bool = any(character in directory_path for character in _GLOB_CHARACTERS) and \
+        (is_remote or not os.path.isdir(directory_path))
 
-    # Define SQL statements
-    sql_statements: list = []
+    # A single (local) file is only copied when the caller explicitly asked for an output file
+    copy_single_file: bool = output_file is not None and output_format == 'csv' and not columns and not is_remote
+
+    if output_file is None:
+        output_file = 'combined.parquet' if output_format == 'parquet' else 'combined.csv'
+
+    if is_pattern:
+        output_path: str = output_file
+    elif is_remote:
+        output_path = directory_path.rstrip('/') + '/' + output_file
+    else:
+        output_path = os.path.join(directory_path, output_file)
+
+    if is_pattern or is_remote:
+        # Let DuckDB expand the pattern in one call (object stores are listed by prefix, not per entry)
+        pattern: str = directory_path if is_pattern else directory_path.rstrip('/') + '/*.csv'
+        con = _cursor()
+        csv_files: list = [file for (file,) in con.execute("SELECT file FROM glob(?)", [pattern]).fetchall()]
+        con.close()
+    else:
+        # Find all CSV files (any extension case, e.g. '.csv' or '.CSV') in the specified directory, skipping
+        # hidden files like a '*.csv' glob would. DirEntry.is_file() uses the file type returned by the directory
+        # listing, avoiding a stat per entry. A missing path or a file falls through to the 'No CSV files' message.
+        try:
+            with os.scandir(directory_path) as entries:
+                csv_files = [entry.path for entry in entries
+                             if entry.is_file() and not entry.name.startswith('.')
+                             and entry.name.lower().endswith('.csv')]
+        except (FileNotFoundError, NotADirectoryError):
+            csv_files = []
 
     if not csv_files:
         click.echo(f'No CSV files found in directory: {directory_path}')
         return
 
-    if len(csv_files) > 1:
+    # A single file is still converted to Parquet or returned as an Arrow reader, since it isn't a CSV copy
+    if len(csv_files) > 1 or output_format != 'csv':
         click.echo(f'Found {len(csv_files)} CSV files to combine.')
-        click.echo('CSV Files:')
-        for idx, file in enumerate(csv_files):
-            click.echo(f' - {file}')
-
-            if idx > 0:
-                if not all:
-                    sql_statements.append("UNION BY NAME")
-                else:
-                    sql_statements.append("UNION ALL BY NAME")
-            
-            sql_statements.append(f"SELECT * FROM read_csv_auto('{file}', header=True)")
-
-        click.echo(f'Combining CSV files into: {os.path.join(directory_path, output_file)}')
+
+        if verbose:
+            click.echo('CSV Files:\n' + '\n'.join(f' - {file}' for file in csv_files))
+
+        if output_format != 'arrow':
+            click.echo(f'Combining CSV files into: {output_path}')
+    elif copy_single_file and os.path.abspath(csv_files[0]) != os.path.abspath(output_path):
+        # Nothing to combine, so copy the file instead of having DuckDB parse and re-write it
+        shutil.copyfile(csv_files[0], output_path)
+        click.echo(f'Only one CSV file found. Copied {csv_files[0]} to: {output_path}')
+        return
     else:
         click.echo('Only one CSV file found. There is no point to combining a single file.')
         return
 
-    sql_statements_str: str = '\n'.join(sql_statements)
-    click.echo(f'SQL Statement:\n{sql_statements_str}')
+    # Read all files in a single multi-file scan, matching columns by name (DISTINCT removes duplicates).
+    # The file list is bound as a parameter, so paths containing quotes need no escaping.
+    sql_statement: str = (f"SELECT {'' if all else 'DISTINCT '}{_select_list(columns)} "
+                          f"FROM read_csv_auto(?, header=True, union_by_name=True, filename=False)")
+
+    if verbose:
+        click.echo(f'SQL Statement:\n{sql_statement}')
+
+    # Get a cursor on the shared DuckDB connection
+    con = _cursor()
+
+    # Stream Arrow record batches to the caller instead of writing a file (the reader keeps the cursor open)
+    if output_format == 'arrow':
+        return con.execute(sql_statement, [csv_files]).fetch_record_batch(rows_per_batch=_BATCH_SIZE)
+
+    # Pull record batches through a CSV writer, so only one batch is held in memory at a time
+    if stream:
+        import pyarrow.csv
+
+        reader = con.execute(sql_statement, [csv_files]).fetch_record_batch(rows_per_batch=_BATCH_SIZE)
 
-    # Create a DuckDB connection
-    con = duckdb.connect(database=':memory:')
+        with pyarrow.csv.CSVWriter(output_path, reader.schema) as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+
+        con.close()
+        return
+
+    # COPY targets can't be bound as parameters, so the output path is escaped instead
+    output_path = output_path.replace("'", "''")
+
+    if output_format == 'parquet':
+        copy_options: str = f"FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE {_BATCH_SIZE}"
+    else:
+        copy_options = "HEADER TRUE, FORMAT CSV"
 
     # Use DuckDB to read and combine CSV files and retain headers for all files
     statement: str = f"""
     COPY (
-        {sql_statements_str}
-    ) TO '{os.path.join(directory_path, output_file)}' WITH (HEADER TRUE);
+        {sql_statement}
+    ) TO '{output_path}' ({copy_options});
     """
 
-    con.execute(statement)
+    con.execute(statement, [csv_files])
     con.close()
 
 
-def split_csv_file(input_file: str, output_directory: str = None, chunk_size: int = 1000) -> None:
+def split_csv_file(input_file: str,
+                   output_directory: str = None,
+                   chunk_size: int = 1000,
+                   columns: list[str] = None) -> None:
     """
-    Splits a large CSV file into smaller chunks.
+    Splits a large CSV file into smaller chunks named 'split_<n>.csv' (numbered from 1).
 
     :param input_file: The path to the input CSV file.
     :param output_directory: The directory where the split files will be saved.
     :param chunk_size: The number of rows per split file.
+    :param columns: The names of the columns to keep (all columns if not specified).
     """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive number of rows, not {chunk_size}.")
+
     if output_directory is None:
-        output_directory = os.path.dirname(input_file)
+        output_directory = os.path.dirname(input_file) or '.'
 
     # Create output directory if it doesn't exist
     os.makedirs(output_directory, exist_ok=True)
 
-    # Create a DuckDB connection
-    con = duckdb.connect(database=':memory:')
-
-    # Read the input CSV file
-    con.execute(f"CREATE TABLE temp AS SELECT * FROM read_csv_auto('{input_file}', header=True);")
-
-    # Get total number of rows
-    total_rows = con.execute("SELECT COUNT(*) FROM temp;").fetchone()[0]
-
-    # Split the CSV file into chunks
-    for start in range(0, total_rows, chunk_size):
-        end = min(start + chunk_size, total_rows)
-        output_file = os.path.join(output_directory, f'split_{start // chunk_size + 1}.csv')
+    # Get a cursor on the shared DuckDB connection (temporary tables are private to the cursor)
+    con = _cursor()
 
+    try:
+        # Number the rows once, in file order. row_number() OVER () runs as a streaming window, and the rows are
+        # inserted in that order, so each chunk's row range below is read from only a few row groups.
         con.execute(f"""
-        COPY (
-            SELECT * FROM temp
-            LIMIT {chunk_size} OFFSET {start}
-        ) TO '{output_file}' WITH (HEADER TRUE);
-        """)
-
-        click.echo(f'Created split file: {output_file}')
-
-    con.close()
\ No newline at end of file
+        CREATE TEMP TABLE {_SPLIT_ROWS_TABLE} AS
+        SELECT {_select_list(columns)}, row_number() OVER () - 1 AS {_SPLIT_ROW_COLUMN}
+        FROM read_csv_auto(?, header=True);
+        """, [input_file])
+
+        (row_count,) = con.execute(f'SELECT count(*) FROM {_SPLIT_ROWS_TABLE};').fetchone()
+
+        # Export each chunk sorted by its row number, since scan order isn't guaranteed to match file order
+        for part, offset in enumerate(range(0, row_count, chunk_size), start=1):
+            output_file: str = os.path.join(output_directory, f'split_{part}.csv')
+
+            # COPY targets can't be bound as parameters, so the output path is escaped instead
+            output_path: str = output_file.replace("'", "''")
+
+            con.execute(f"""
+            COPY (
+                SELECT * EXCLUDE ({_SPLIT_ROW_COLUMN})
+                FROM {_SPLIT_ROWS_TABLE}
+                WHERE {_SPLIT_ROW_COLUMN} >= ? AND {_SPLIT_ROW_COLUMN} < ?
+                ORDER BY {_SPLIT_ROW_COLUMN}
+            ) TO '{output_path}' (FORMAT CSV, HEADER TRUE);
+            """, [offset, offset + chunk_size])
+
+            click.echo(f'Created split file: {output_file}')
+    finally:
+        con.close()
@@ -1,12 +1,14 @@
-import importlib
+import contextlib
+import importlib.util
+import io
 import os
-import sys
 import tempfile
-import types
 import unittest
 
+import duckdb
 from click.testing import CliRunner
 
+import automatey.cli as cli
 import automatey.duck_tools as duck_tools
 
 
@@ -15,6 +17,10 @@ class TestCombineCSVFiles(unittest.TestCase):
 		with open(path, 'w', newline='') as fh:
 			fh.write('\n'.join(rows))
 
+	def _write_csv_bulk(self, path: str, relation: duckdb.DuckDBPyRelation):
+		# Large fixtures are written by DuckDB's vectorized CSV writer instead of joining rows in Python
+		relation.write_csv(path, header=True)
+
 	def test_combine_csv_files_function_removes_duplicates_by_default(self):
 		# Create a temporary directory with two CSV files where one row is duplicated
 		with tempfile.TemporaryDirectory() as td:
@@ -49,55 +55,216 @@ class TestCombineCSVFiles(unittest.TestCase):
 			self.assertIn('2,B', data_rows)
 			self.assertIn('3,C', data_rows)
 
+	def test_combine_csv_files_removes_duplicates_across_large_files(self):
+		with tempfile.TemporaryDirectory() as td:
+			# ids 0-19999 and 10000-29999 -> 10000 duplicated rows
+			self._write_csv_bulk(os.path.join(td, 'mock_data1.csv'),
+								 duckdb.sql("SELECT range AS id, 'N' || range AS name FROM range(0, 20000)"))
+			self._write_csv_bulk(os.path.join(td, 'mock_data2.csv'),
+								 duckdb.sql("SELECT range AS id, 'N' || range AS name FROM range(10000, 30000)"))
+
+			duck_tools.combine_csv_files(directory_path=td, output_file='combined.csv')
+
+			combined = duckdb.sql(f"SELECT count(*), count(DISTINCT id), min(id), max(id) "
+								  f"FROM read_csv_auto('{os.path.join(td, 'combined.csv')}', header=True)").fetchone()
+			self.assertEqual(combined, (30000, 30000, 0, 29999))
+
+	@unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+	def test_combine_csv_files_streams_record_batches(self):
+		with tempfile.TemporaryDirectory() as td:
+			self._write_csv_bulk(os.path.join(td, 'mock_data1.csv'),
+								 duckdb.sql("SELECT range AS id, 'N' || range AS name FROM range(0, 150000)"))
+			self._write_csv_bulk(os.path.join(td, 'mock_data2.csv'),
+								 duckdb.sql("SELECT range AS id, 'N' || range AS name FROM range(150000, 200000)"))
+
+			duck_tools.combine_csv_files(directory_path=td, output_file='combined.csv', all=True, stream=True)
+
+			# More rows than a single record batch, all written behind one header
+			combined = duckdb.sql(f"SELECT count(*), count(DISTINCT id), max(name) "
+								  f"FROM read_csv_auto('{os.path.join(td, 'combined.csv')}', header=True)").fetchone()
+			self.assertEqual(combined, (200000, 200000, 'N99999'))
+
+	def test_combine_csv_files_writes_parquet(self):
+		with tempfile.TemporaryDirectory() as td:
+			self._write_csv(os.path.join(td, 'mock_data1.csv'), ['id,name', '1,A', '2,B'])
+			self._write_csv(os.path.join(td, 'mock_data2.csv'), ['id,name', '2,B', '3,C'])
+
+			duck_tools.combine_csv_files(directory_path=td, output_format='parquet')
+
+			# Parquet output defaults to a '.parquet' name, so it isn't picked up as a CSV input later
+			combined = os.path.join(td, 'combined.parquet')
+			self.assertFalse(os.path.exists(os.path.join(td, 'combined.csv')))
+
+			rows = duckdb.sql(f"SELECT id, name FROM read_parquet('{combined}') ORDER BY id").fetchall()
+			self.assertEqual(rows, [(1, 'A'), (2, 'B'), (3, 'C')])
+
+		# A single file is converted too, rather than skipped as having nothing to combine
+		with tempfile.TemporaryDirectory() as td:
+			self._write_csv(os.path.join(td, 'mock_data1.csv'), ['id,name', '1,A', '2,B'])
+
+			duck_tools.combine_csv_files(directory_path=td, output_format='parquet')
+
+			combined = os.path.join(td, 'combined.parquet')
+			rows = duckdb.sql(f"SELECT id, name FROM read_parquet('{combined}') ORDER BY id").fetchall()
+			self.assertEqual(rows, [(1, 'A'), (2, 'B')])
+
+	@unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+	def test_combine_csv_files_returns_arrow_reader(self):
+		with tempfile.TemporaryDirectory() as td:
+			self._write_csv(os.path.join(td, 'mock_data1.csv'), ['id,name', '1,A', '2,B'])
+
+			# A single file still yields a reader, and nothing is written
+			reader = duck_tools.combine_csv_files(directory_path=td, output_format='arrow')
+			self.assertEqual(reader.read_all().to_pylist(), [{'id': 1, 'name': 'A'}, {'id': 2, 'name': 'B'}])
+			self.assertEqual(os.listdir(td), ['mock_data1.csv'])
+
+			self._write_csv(os.path.join(td, 'mock_data2.csv'), ['id,name', '2,B', '3,C'])
+
+			reader = duck_tools.combine_csv_files(directory_path=td, output_format='arrow', all=True)
+			self.assertEqual(sorted(reader.read_all().column('id').to_pylist()), [1, 2, 2, 3])
+
+	def test_combine_csv_files_rejects_stream_for_non_csv_formats(self):
+		for output_format in ('parquet', 'arrow'):
+			with self.assertRaises(ValueError):
+				duck_tools.combine_csv_files(directory_path='.', output_format=output_format, stream=True)
+
+	def test_combine_csv_files_selects_requested_columns(self):
+		with tempfile.TemporaryDirectory() as td:
+			self._write_csv(os.path.join(td, 'mock_data1.csv'), ['id,name', '1,A', '2,B'])
+			self._write_csv(os.path.join(td, 'mock_data2.csv'), ['id,name', '3,B', '4,C'])
+
+			duck_tools.combine_csv_files(directory_path=td, output_file='combined.csv', columns=['name'])
+
+			with open(os.path.join(td, 'combined.csv'), 'r', newline='') as fh:
+				lines = [ln.strip() for ln in fh.read().splitlines() if ln.strip()]
+
+			# Only the selected column is written, and duplicates are removed on that column
+			self.assertEqual(lines[0], 'name')
+			self.assertEqual(sorted(lines[1:]), ['A', 'B', 'C'])
+
+	def test_combine_csv_files_accepts_glob_pattern(self):
+		with tempfile.TemporaryDirectory() as td:
+			self._write_csv(os.path.join(td, 'mock_data1.csv'), ['id,name', '1,A'])
+			self._write_csv(os.path.join(td, 'mock_data2.csv'), ['id,name', '2,B'])
+			self._write_csv(os.path.join(td, 'other.csv'), ['id,name', '3,C'])
+
+			# The pattern is expanded by DuckDB; only the matching files are combined
+			combined = os.path.join(td, 'combined.csv')
+			duck_tools.combine_csv_files(directory_path=os.path.join(td, 'mock_*.csv'), output_file=combined)
+
+			with open(combined, 'r', newline='') as fh:
+				lines = [ln.strip() for ln in fh.read().splitlines() if ln.strip()]
+
+			self.assertEqual(lines[0], 'id,name')
+			self.assertEqual(sorted(lines[1:]), ['1,A', '2,B'])
+
+	def test_combine_csv_files_skips_hidden_files(self):
+		with tempfile.TemporaryDirectory() as td:
+			self._write_csv(os.path.join(td, 'mock_data1.csv'), ['id,name', '1,A'])
+			self._write_csv(os.path.join(td, 'mock_data2.csv'), ['id,name', '2,B'])
+			self._write_csv(os.path.join(td, '.~lock.csv'), ['id,name', '3,C'])
+
+			duck_tools.combine_csv_files(directory_path=td)
+
+			with open(os.path.join(td, 'combined.csv'), 'r', newline='') as fh:
+				lines = [ln.strip() for ln in fh.read().splitlines() if ln.strip()]
+
+			# Hidden files are skipped, like a '*.csv' glob would
+			self.assertEqual(sorted(lines[1:]), ['1,A', '2,B'])
+
+	def test_combine_csv_files_reports_missing_directory(self):
+		with tempfile.TemporaryDirectory() as td:
+			self._write_csv(os.path.join(td, 'mock_data1.csv'), ['id,name', '1,A'])
+
+			# Neither a missing path nor a file path raises; both report that no CSV files were found
+			for directory_path in (os.path.join(td, 'missing'), os.path.join(td, 'mock_data1.csv')):
+				output = io.StringIO()
+
+				with contextlib.redirect_stdout(output):
+					result = duck_tools.combine_csv_files(directory_path=directory_path)
+
+				self.assertIsNone(result)
+				self.assertEqual(output.getvalue().strip(), f'No CSV files found in directory: {directory_path}')
+
+	def test_combine_csv_files_treats_bracketed_directory_as_directory(self):
+		with tempfile.TemporaryDirectory() as td:
+			# Glob characters in an existing directory's name don't turn it into a pattern
+			directory = os.path.join(td, 'data [2024]')
+			os.makedirs(directory)
+			self._write_csv(os.path.join(directory, 'mock_data1.csv'), ['id,name', '1,A'])
+			self._write_csv(os.path.join(directory, 'mock_data2.csv'), ['id,name', '2,B'])
+
+			duck_tools.combine_csv_files(directory_path=directory)
+
+			with open(os.path.join(directory, 'combined.csv'), 'r', newline='') as fh:
+				lines = [ln.strip() for ln in fh.read().splitlines() if ln.strip()]
+
+			self.assertEqual(lines[0], 'id,name')
+			self.assertEqual(sorted(lines[1:]), ['1,A', '2,B'])
+
+	def test_combine_csv_files_handles_quotes_in_file_names(self):
+		with tempfile.TemporaryDirectory() as td:
+			# Paths are bound as query parameters, so apostrophes don't break the SQL
+			directory = os.path.join(td, "o'brien")
+			os.makedirs(directory)
+			self._write_csv(os.path.join(directory, "a'b.csv"), ['id,name', '1,A'])
+			self._write_csv(os.path.join(directory, 'mock_data2.csv'), ['id,name', '2,B'])
+
+			duck_tools.combine_csv_files(directory_path=directory, output_file="combined'.csv")
+
+			with open(os.path.join(directory, "combined'.csv"), 'r', newline='') as fh:
+				lines = [ln.strip() for ln in fh.read().splitlines() if ln.strip()]
+
+			self.assertEqual(lines[0], 'id,name')
+			self.assertEqual(sorted(lines[1:]), ['1,A', '2,B'])
+
+	def test_combine_csv_files_copies_single_file_to_explicit_output(self):
+		with tempfile.TemporaryDirectory() as td:
+			rows = ['id,name', '1,A', '1,A']
+			self._write_csv(os.path.join(td, 'mock_data1.csv'), rows)
+
+			# Without an explicit output file there is nothing to do
+			duck_tools.combine_csv_files(directory_path=td)
+			self.assertFalse(os.path.exists(os.path.join(td, 'combined.csv')))
+
+			# With one, the single file is copied unchanged
+			duck_tools.combine_csv_files(directory_path=td, output_file='copy.csv')
+
+			with open(os.path.join(td, 'copy.csv'), 'r', newline='') as fh:
+				self.assertEqual(fh.read(), '\n'.join(rows))
+
 	def test_cli_runner_all_option_keeps_duplicates(self):
-		# Prepare a fake module at import-time so importing automatey.cli succeeds
-		fake_name = 'automatey.data_tools'
-		fake_module = types.ModuleType(fake_name)
-		fake_module.combine_csv_files = duck_tools.combine_csv_files
-
-		# Insert the fake module into sys.modules before importing the CLI
-		sys.modules[fake_name] = fake_module
-		try:
-			# Import the CLI module (it imports combine_csv_files from automatey.data_tools)
-			import automatey.cli as cli
-			importlib.reload(cli)
-
-			runner = CliRunner()
-
-			# Use an isolated filesystem for the CLI run so current directory is our test dir
-			with runner.isolated_filesystem():
-				# create CSV files in the current working directory
-				with open('mock_data1.csv', 'w', newline='') as fh:
-					fh.write('\n'.join(['id,name', '1,A', '2,B']))
-
-				with open('mock_data2.CSV', 'w', newline='') as fh:
-					# use uppercase extension to ensure glob is case-sensitive on some platforms
-					fh.write('\n'.join(['id,name', '2,B', '3,C']))
-
-				# Invoke CLI with --all to retain duplicates (UNION ALL BY NAME)
-				result = runner.invoke(cli.combine_csv_files_command, ['--all'])
-				self.assertEqual(result.exit_code, 0, msg=result.output)
-
-				combined = os.path.join(os.getcwd(), 'combined.csv')
-				self.assertTrue(os.path.exists(combined), 'Combined CSV was not created by CLI')
-
-				with open(combined, 'r', newline='') as fh:
-					lines = [ln.strip() for ln in fh.read().splitlines() if ln.strip()]
-
-				# Header plus rows; duplicates should be preserved -> rows: 1,A ; 2,B ; 2,B ; 3,C
-				self.assertGreaterEqual(len(lines), 1)
-				header = lines[0]
-				self.assertEqual(header, 'id,name')
-
-				data_rows = lines[1:]
-				self.assertEqual(len(data_rows), 4)
-				# Check duplicate exists
-				self.assertEqual([r for r in data_rows if r == '2,B'].__len__(), 2)
-
-		finally:
-			# Clean up the fake module to avoid leaking into other tests
-			if fake_name in sys.modules:
-				del sys.modules[fake_name]
+		runner = CliRunner()
+
+		# Use an isolated filesystem for the CLI run so current directory is our test dir
+		with runner.isolated_filesystem():
+			# create CSV files in the current working directory
+			with open('mock_data1.csv', 'w', newline='') as fh:
+				fh.write('\n'.join(['id,name', '1,A', '2,B']))
+
+			with open('mock_data2.CSV', 'w', newline='') as fh:
+				# use uppercase extension to ensure CSV discovery is case-insensitive
+				fh.write('\n'.join(['id,name', '2,B', '3,C']))
+
+			# Invoke CLI with --all to retain duplicates (no DISTINCT)
+			result = runner.invoke(cli.combine_csv_files_command, ['--all'])
+			self.assertEqual(result.exit_code, 0, msg=result.output)
+
+			combined = os.path.join(os.getcwd(), 'combined.csv')
+			self.assertTrue(os.path.exists(combined), 'Combined CSV was not created by CLI')
+
+			with open(combined, 'r', newline='') as fh:
+				lines = [ln.strip() for ln in fh.read().splitlines() if ln.strip()]
+
+			# Header plus rows; duplicates should be preserved -> rows: 1,A ; 2,B ; 2,B ; 3,C
+			self.assertGreaterEqual(len(lines), 1)
+			header = lines[0]
+			self.assertEqual(header, 'id,name')
+
+			data_rows = lines[1:]
+			self.assertEqual(len(data_rows), 4)
+			# Check duplicate exists
+			self.assertEqual([r for r in data_rows if r == '2,B'].__len__(), 2)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+
+import automatey.duck_tools as duck_tools
+
+
+class TestSplitCSVFile(unittest.TestCase):
+	def _write_csv(self, path: str, rows: list[str]):
+		with open(path, 'w', newline='') as fh:
+			fh.write('\n'.join(rows))
+
+	def _read_lines(self, path: str) -> list[str]:
+		with open(path, 'r', newline='') as fh:
+			return [ln.strip() for ln in fh.read().splitlines() if ln.strip()]
+
+	def test_split_csv_file_writes_ordered_chunks_with_headers(self):
+		with tempfile.TemporaryDirectory() as td:
+			input_file = os.path.join(td, 'input.csv')
+			output_directory = os.path.join(td, 'splits')
+
+			# header + 25 rows -> chunks of 10, 10 and 5 rows
+			self._write_csv(input_file, ['id,name'] + [f'{i},N{i}' for i in range(25)])
+
+			duck_tools.split_csv_file(input_file, output_directory=output_directory, chunk_size=10)
+
+			# Only the split files are written
+			self.assertEqual(sorted(os.listdir(output_directory)), ['split_1.csv', 'split_2.csv', 'split_3.csv'])
+
+			data_rows = []
+			for idx, expected_rows in enumerate([10, 10, 5], start=1):
+				lines = self._read_lines(os.path.join(output_directory, f'split_{idx}.csv'))
+				self.assertEqual(lines[0], 'id,name')
+				self.assertEqual(len(lines) - 1, expected_rows)
+				data_rows.extend(lines[1:])
+
+			# Rows keep their original order across chunks
+			self.assertEqual(data_rows, [f'{i},N{i}' for i in range(25)])
+
+	def test_split_csv_file_keeps_file_order_in_large_inputs(self):
+		with tempfile.TemporaryDirectory() as td:
+			input_file = os.path.join(td, 'input.csv')
+			output_directory = os.path.join(td, 'splits')
+
+			# 300,000 rows span many DuckDB vectors and row groups, so scan order can differ from file order
+			with open(input_file, 'w', newline='') as fh:
+				fh.write('id\n')
+				fh.writelines(f'{i}\n' for i in range(300_000))
+
+			duck_tools.split_csv_file(input_file, output_directory=output_directory, chunk_size=1000)
+
+			self.assertEqual(len(os.listdir(output_directory)), 300)
+
+			for idx in range(300):
+				lines = self._read_lines(os.path.join(output_directory, f'split_{idx + 1}.csv'))
+				self.assertEqual(lines[0], 'id')
+				self.assertEqual(lines[1:], [str(i) for i in range(idx * 1000, (idx + 1) * 1000)])
+
+	def test_split_csv_file_defaults_to_input_directory(self):
+		with tempfile.TemporaryDirectory() as td:
+			input_file = os.path.join(td, 'input.csv')
+			self._write_csv(input_file, ['id,name', '1,A', '2,B', '3,C'])
+
+			duck_tools.split_csv_file(input_file, chunk_size=2)
+
+			self.assertEqual(sorted(os.listdir(td)), ['input.csv', 'split_1.csv', 'split_2.csv'])
+			self.assertEqual(self._read_lines(os.path.join(td, 'split_2.csv')), ['id,name', '3,C'])
+
+	def test_split_csv_file_handles_quotes_in_paths(self):
+		with tempfile.TemporaryDirectory() as td:
+			directory = os.path.join(td, "o'brien")
+			os.makedirs(directory)
+			input_file = os.path.join(directory, "a'b.csv")
+			self._write_csv(input_file, ['id,name', '1,A', '2,B'])
+
+			duck_tools.split_csv_file(input_file, chunk_size=1)
+
+			self.assertEqual(self._read_lines(os.path.join(directory, 'split_2.csv')), ['id,name', '2,B'])
+
+	def test_split_csv_file_keeps_input_column_named_part(self):
+		with tempfile.TemporaryDirectory() as td:
+			input_file = os.path.join(td, 'input.csv')
+			self._write_csv(input_file, ['id,part', '1,A', '2,B', '3,C'])
+
+			duck_tools.split_csv_file(input_file, chunk_size=2)
+
+			self.assertEqual(self._read_lines(os.path.join(td, 'split_1.csv')), ['id,part', '1,A', '2,B'])
+			self.assertEqual(self._read_lines(os.path.join(td, 'split_2.csv')), ['id,part', '3,C'])
+
+	def test_split_csv_file_rejects_non_positive_chunk_size(self):
+		with self.assertRaises(ValueError):
+			duck_tools.split_csv_file('input.csv', chunk_size=0)
+
+
+if __name__ == '__main__':
+	unittest.main()